@@ -1,5 +1,83 @@
+import numpy as np
 from numpy import exp, sqrt, log
-from scipy.stats import norm
+from scipy.special import ndtr
+
+# 1/sqrt(2*pi), the normal PDF normalization constant
+INV_SQRT_2PI = 0.39894228040143268
+
+
+def ndtr_fast(x):
+    """
+    Fast normal CDF approximation (Abramowitz & Stegun 26.2.17).
+
+    A 5-term Horner polynomial in t = 1/(1 + 0.2316419*|x|) scaled by the
+    normal PDF, folded by sign symmetry. Accurate to ~7.5e-8 — far beyond
+    the 2-decimal precision the heatmaps display — and branch-free over
+    arrays, unlike ndtr's rational tail regions. Used on the grid hot
+    path only; the scalar pricing in BlackScholes.run() keeps ndtr.
+    """
+    abs_x = np.abs(x)
+    t = 1.0 / (1.0 + 0.2316419 * abs_x)
+    poly = ((((1.330274429 * t - 1.821255978) * t + 1.781477937) * t
+             - 0.356563782) * t + 0.319381530) * t
+    tail = np.exp(-0.5 * abs_x * abs_x) * INV_SQRT_2PI * poly
+    return np.where(x >= 0.0, 1.0 - tail, tail)
+
+
+def bs_prices(time_to_maturity, strike, spot, volatility, interest_rate,
+              cdf=ndtr):
+    """
+    Black-Scholes call and put prices for scalar or array inputs.
+
+    The core pricing math as a free function: parameter sweeps pass
+    NumPy arrays (one array per parameter, struct-of-arrays style)
+    instead of allocating one BlackScholes instance per point.
+
+    Parameters:
+    - time_to_maturity: Time to expiration (years)
+    - strike: Strike price of the option
+    - spot: Spot price(s) — scalar or broadcastable array
+    - volatility: Volatility(ies) — scalar or broadcastable array
+    - interest_rate: Risk-free interest rate (annualized)
+    - cdf: normal CDF to use (ndtr by default, ndtr_fast for display-only
+      precision)
+
+    Returns a (call, put) pair with the broadcast shape of the inputs.
+    The CDF is evaluated only twice; puts follow from put-call parity.
+    """
+    sqrt_t = np.sqrt(time_to_maturity)
+    discount = np.exp(-interest_rate * time_to_maturity)
+    # log(S) - log(K) instead of log(S/K): no elementwise division, and
+    # for a grid sweep log(K) is a scalar computed once outside the
+    # broadcast
+    log_strike = np.log(strike)
+    d1 = (
+        np.log(spot) - log_strike +
+        (interest_rate + 0.5 * volatility ** 2) * time_to_maturity
+    ) / (volatility * sqrt_t)
+    d2 = d1 - volatility * sqrt_t
+    call = spot * cdf(d1) - strike * discount * cdf(d2)
+    put = call - spot + strike * discount
+    return call, put
+
+
+def bs_grid(spot, vol, time_to_maturity, strike, interest_rate):
+    """
+    Vectorized Black-Scholes pricing over a grid of spot prices and
+    volatilities.
+
+    Parameters:
+    - spot: 2-D array of spot prices (broadcastable, e.g. spot_range[None, :])
+    - vol: 2-D array of volatilities (broadcastable, e.g. vol_range[:, None])
+    - time_to_maturity: Time to expiration (years)
+    - strike: Strike price of the option
+    - interest_rate: Risk-free interest rate (annualized)
+
+    Returns a (call_prices, put_prices) pair of arrays with the broadcast
+    shape of spot and vol, priced with the fast display-precision CDF.
+    """
+    return bs_prices(time_to_maturity, strike, spot, vol, interest_rate,
+                     cdf=ndtr_fast)
 
 
 class BlackScholes:
@@ -9,15 +87,19 @@ class BlackScholes:
 
     def __init__(
         self,
-        time_to_maturity: float,
-        strike: float,
-        current_price: float,
-        volatility: float,
-        interest_rate: float,
+        time_to_maturity: "np.ndarray | float",
+        strike: "np.ndarray | float",
+        current_price: "np.ndarray | float",
+        volatility: "np.ndarray | float",
+        interest_rate: "np.ndarray | float",
     ):
         """
         Initialize the Black-Scholes model with parameters.
 
+        Each parameter may be a scalar or a broadcastable NumPy array;
+        with array inputs, run() produces broadcast-shaped arrays of
+        prices and greeks.
+
         Parameters:
         - time_to_maturity: Time to expiration (years)
         - strike: Strike price of the option
@@ -31,32 +113,67 @@ class BlackScholes:
         self.volatility = volatility
         self.interest_rate = interest_rate
 
+    @classmethod
+    def from_arrays(cls, time_to_maturity, strike, current_price, volatility,
+                    interest_rate):
+        """
+        Build a batched model from array parameters (e.g. an option
+        chain), converting each input to a NumPy array so they broadcast
+        against each other in run().
+        """
+        return cls(
+            time_to_maturity=np.asarray(time_to_maturity),
+            strike=np.asarray(strike),
+            current_price=np.asarray(current_price),
+            volatility=np.asarray(volatility),
+            interest_rate=np.asarray(interest_rate),
+        )
+
     def run(
         self,
     ):
+        """
+        Price the option and compute the greeks.
+
+        Returns the (call_price, put_price) pair; the prices and the
+        delta/gamma greeks are also stored as attributes, so callers can
+        unpack the return value directly without a second evaluation.
+        With array parameters, both return values and the greeks have the
+        broadcast shape of the inputs — the whole batch is priced in one
+        pass with no Python-level loop.
+        """
         time_to_maturity = self.time_to_maturity
         strike = self.strike
         current_price = self.current_price
         volatility = self.volatility
         interest_rate = self.interest_rate
+
+        # Shared subexpressions: sqrt(T), the discount factor and the
+        # normal CDF values are each computed once and reused across the
+        # prices and greeks below.
+        sqrt_t = sqrt(time_to_maturity)
+        discount = exp(-(interest_rate * time_to_maturity))
         d1 = self.calculate_d1(time_to_maturity, strike,
-                               current_price, volatility, interest_rate)
-        d2 = self.calculate_d2(time_to_maturity, volatility, d1)
+                               current_price, volatility, interest_rate,
+                               sqrt_t)
+        d2 = self.calculate_d2(volatility, d1, sqrt_t)
+        cdf_d1 = ndtr(d1)
+        cdf_d2 = ndtr(d2)
         call_price = self.call_option_price(
-            time_to_maturity, strike, current_price, interest_rate, d1, d2)
+            strike, current_price, discount, cdf_d1, cdf_d2)
         put_price = self.put_option_price(
-            time_to_maturity, strike, current_price, interest_rate, d1, d2)
+            strike, current_price, discount, call_price)
         self.set_option_prices(call_price, put_price)
 
         # GREEKS
         # Delta
-        self.calculate_greeks_delta(d1)
+        self.calculate_greeks_delta(cdf_d1)
 
         # Gamma
-        self.calculate_greeks_gamma(time_to_maturity, strike, volatility, d1)
+        self.calculate_greeks_gamma(strike, volatility, d1, sqrt_t)
         return self.call_price, self.put_price
 
-    def calculate_d1(self, time_to_maturity, strike, current_price, volatility, interest_rate):
+    def calculate_d1(self, time_to_maturity, strike, current_price, volatility, interest_rate, sqrt_t):
         """
         Calculate d1 used in the Black-Scholes formula.
         """
@@ -64,34 +181,32 @@ class BlackScholes:
             log(current_price / strike) +
             (interest_rate + 0.5 * volatility ** 2) * time_to_maturity
         ) / (
-            volatility * sqrt(time_to_maturity)
+            volatility * sqrt_t
         )
         return d1
 
-    def calculate_d2(self, time_to_maturity, volatility, d1):
+    def calculate_d2(self, volatility, d1, sqrt_t):
         """
         Calculate d2 used in the Black-Scholes formula.
         """
-        d2 = d1 - volatility * sqrt(time_to_maturity)
+        d2 = d1 - volatility * sqrt_t
         return d2
 
-    def call_option_price(self, time_to_maturity, strike, current_price, interest_rate, d1, d2):
+    def call_option_price(self, strike, current_price, discount, cdf_d1, cdf_d2):
         """
         Calculate the Black-Scholes price for a European call option.
         """
-        call_price = current_price * norm.cdf(d1) - (
-            strike * exp(-(interest_rate * time_to_maturity)) * norm.cdf(d2)
-        )
+        call_price = current_price * cdf_d1 - strike * discount * cdf_d2
 
         return call_price
 
-    def put_option_price(self, time_to_maturity, strike, current_price, interest_rate, d1, d2):
+    def put_option_price(self, strike, current_price, discount, call_price):
         """
-        Calculate the Black-Scholes price for a European put option.
+        Calculate the Black-Scholes price for a European put option via
+        put-call parity, reusing the call price instead of evaluating the
+        normal CDF at -d1 and -d2.
         """
-        put_price = (
-            strike * exp(-(interest_rate * time_to_maturity)) * norm.cdf(-d2)
-        ) - current_price * norm.cdf(-d1)
+        put_price = call_price - current_price + strike * discount
 
         return put_price
 
@@ -102,20 +217,22 @@ class BlackScholes:
         self.call_price = call_price
         self.put_price = put_price
 
-    def calculate_greeks_delta(self, d1):
+    def calculate_greeks_delta(self, cdf_d1):
         """
         Calculate the greeks delta.
         """
-        self.call_delta = norm.cdf(d1)
-        self.put_delta = 1 - norm.cdf(d1)
+        self.call_delta = cdf_d1
+        self.put_delta = 1 - cdf_d1
 
-    def calculate_greeks_gamma(self, time_to_maturity, strike, volatility, d1):
+    def calculate_greeks_gamma(self, strike, volatility, d1, sqrt_t):
         """
         Calculate the greeks gamma.
         """
-        self.call_gamma = norm.pdf(d1) / (
-            strike * volatility * sqrt(time_to_maturity)
-        )
+        # norm.pdf(d1) inlined as exp(-d1^2/2) / sqrt(2*pi) to avoid the
+        # scipy.stats distribution dispatch overhead; multiply by the
+        # reciprocal so batched inputs issue one division over the array
+        inv_den = 1.0 / (strike * volatility * sqrt_t)
+        self.call_gamma = exp(-0.5 * d1 * d1) * INV_SQRT_2PI * inv_den
         self.put_gamma = self.call_gamma
 
 
@@ -1,12 +1,14 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 from scipy.stats import norm
 import plotly.graph_objects as go
 from numpy import log, sqrt, exp  # Make sure to import these
-import matplotlib.pyplot as plt
-import seaborn as sns
-from BlackScholes import BlackScholes
+from BlackScholes import BlackScholes, bs_grid
+
+try:
+    from bs_numba import bs_grid_numba
+except ImportError:  # numba is optional; fall back to the NumPy grid
+    bs_grid_numba = None
 
 #######################
 # Page configuration
@@ -113,8 +115,7 @@ input_data = {
     "Volatility σ (annualized) ": [volatility],
     "Risk-Free Interest Rate (%)": [interest_rate/100],
 }
-input_df = pd.DataFrame(input_data)
-st.table(input_df)
+st.table(input_data)
 
 # Calculate Call and Put values
 bs_model = BlackScholes(time_to_maturity, strike,
@@ -122,81 +123,89 @@ bs_model = BlackScholes(time_to_maturity, strike,
 call_price, put_price = bs_model.run()
 
 
-def plot_pnl_heatmap(bs_model, spot_range, vol_range, strike, purchase_price_call, purchase_price_put):
+@st.cache_data(ttl=600)
+def compute_bs_grids(spot_min, spot_max, vol_min, vol_max, time_to_maturity,
+                     strike, interest_rate, grid_size=10):
+    """
+    Compute the call/put price grids for the heatmaps.
+
+    Cached across Streamlit reruns and keyed on the scalar widget inputs,
+    so nudging a widget that does not touch the BS inputs (e.g. a
+    purchase price) reuses the cached grids instead of repricing. The
+    spot/vol ranges are rebuilt from the bounds inside, keeping the cache
+    key a handful of cheap-to-hash floats.
+    """
+    spot_range = np.linspace(spot_min, spot_max, grid_size)
+    vol_range = np.linspace(vol_min, vol_max, grid_size)
+    if bs_grid_numba is not None and len(spot_range) * len(vol_range) > 64:
+        return bs_grid_numba(spot_range, vol_range,
+                             time_to_maturity, strike, interest_rate)
+    return bs_grid(spot_range[None, :], vol_range[:, None],
+                   time_to_maturity, strike, interest_rate)
+
+
+@st.cache_resource(ttl=600)
+def _make_heatmap_fig(z_bytes, shape, xticks, yticks, title):
+    """
+    Build one annotated heatmap figure from raw grid bytes.
+
+    The grid is passed as bytes plus its shape so the cache key is a
+    cheap content hash; identical grids (e.g. reruns where only an
+    unrelated widget moved) reuse the same Figure object instead of
+    rebuilding 100 annotations.
+    """
+    z = np.frombuffer(z_bytes).reshape(shape)
+    fig = go.Figure(go.Heatmap(
+        z=z, x=xticks, y=yticks,
+        colorscale='RdYlGn', text=np.round(z, 2),
+        texttemplate='%{text}'))
+    fig.update_layout(title=title,
+                      xaxis_title='Spot Price',
+                      yaxis_title='Volatility')
+    return fig
+
+
+def _grid_bytes(grid):
+    """Contiguous float64 bytes of a grid, for use as a cache key."""
+    return np.ascontiguousarray(grid, dtype=np.float64).tobytes()
+
+
+def plot_pnl_heatmap(spot_range, vol_range, strike, purchase_price_call, purchase_price_put, spot_ticks, vol_ticks):
     """
     Plot P&L heatmaps for Call and Put options based on purchase prices.
+
+    The P&L shown is intrinsic value at expiry minus the purchase price,
+    which does not depend on the Black-Scholes model at all — no pricing
+    is needed here.
     """
-    call_pnl = np.zeros((len(vol_range), len(spot_range)))
-    put_pnl = np.zeros((len(vol_range), len(spot_range)))
-
-    for i, vol in enumerate(vol_range):
-        for j, spot in enumerate(spot_range):
-            bs_temp = BlackScholes(
-                time_to_maturity=bs_model.time_to_maturity,
-                strike=strike,
-                current_price=spot,
-                volatility=vol,
-                interest_rate=bs_model.interest_rate
-            )
-            call_price, put_price = bs_temp.run()
-            # Calculate P&L
-            call_pnl[i, j] = max(0, spot - strike) - purchase_price_call
-            put_pnl[i, j] = max(0, strike - spot) - purchase_price_put
-
-    # Plotting Call P&L Heatmap
-    fig_call, ax_call = plt.subplots(figsize=(10, 8))
-    sns.heatmap(call_pnl, xticklabels=np.round(spot_range, 2), yticklabels=np.round(vol_range, 2),
-                annot=True, fmt=".2f", cmap="RdYlGn", ax=ax_call)
-    ax_call.set_title('Call Option P&L')
-    ax_call.set_xlabel('Spot Price')
-    ax_call.set_ylabel('Volatility')
-
-    # Plotting Put P&L Heatmap
-    fig_put, ax_put = plt.subplots(figsize=(10, 8))
-    sns.heatmap(put_pnl, xticklabels=np.round(spot_range, 2), yticklabels=np.round(vol_range, 2),
-                annot=True, fmt=".2f", cmap="RdYlGn", ax=ax_put)
-    ax_put.set_title('Put Option P&L')
-    ax_put.set_xlabel('Spot Price')
-    ax_put.set_ylabel('Volatility')
+    # Calculate P&L
+    call_pnl = np.maximum(
+        0, spot_range[None, :] - strike) - purchase_price_call
+    put_pnl = np.maximum(
+        0, strike - spot_range[None, :]) - purchase_price_put
+    call_pnl = np.broadcast_to(call_pnl, (len(vol_range), len(spot_range)))
+    put_pnl = np.broadcast_to(put_pnl, (len(vol_range), len(spot_range)))
+
+    xticks = tuple(spot_ticks)
+    yticks = tuple(vol_ticks)
+    fig_call = _make_heatmap_fig(_grid_bytes(call_pnl), call_pnl.shape,
+                                 xticks, yticks, 'Call Option P&L')
+    fig_put = _make_heatmap_fig(_grid_bytes(put_pnl), put_pnl.shape,
+                                xticks, yticks, 'Put Option P&L')
 
     return fig_call, fig_put
 
 
-def plot_heatmap(bs_model, spot_range, vol_range, strike):
+def plot_heatmap(call_prices, put_prices, spot_ticks, vol_ticks):
     """
-    Plot heatmaps for Call and Put options based on Black-Scholes method.
+    Plot heatmaps for Call and Put options from precomputed price grids.
     """
-    call_prices = np.zeros((len(vol_range), len(spot_range)))
-    put_prices = np.zeros((len(vol_range), len(spot_range)))
-
-    for i, vol in enumerate(vol_range):
-        for j, spot in enumerate(spot_range):
-            bs_temp = BlackScholes(
-                time_to_maturity=bs_model.time_to_maturity,
-                strike=strike,
-                current_price=spot,
-                volatility=vol,
-                interest_rate=bs_model.interest_rate
-            )
-            bs_temp.run()
-            call_prices[i, j] = bs_temp.call_price
-            put_prices[i, j] = bs_temp.put_price
-
-    # Plotting Call Price Heatmap
-    fig_call, ax_call = plt.subplots(figsize=(10, 8))
-    sns.heatmap(call_prices, xticklabels=np.round(spot_range, 2), yticklabels=np.round(
-        vol_range, 2), annot=True, fmt=".2f", cmap="RdYlGn", ax=ax_call)
-    ax_call.set_title('CALL')
-    ax_call.set_xlabel('Spot Price')
-    ax_call.set_ylabel('Volatility')
-
-    # Plotting Put Price Heatmap
-    fig_put, ax_put = plt.subplots(figsize=(10, 8))
-    sns.heatmap(put_prices, xticklabels=np.round(spot_range, 2), yticklabels=np.round(
-        vol_range, 2), annot=True, fmt=".2f", cmap="RdYlGn", ax=ax_put)
-    ax_put.set_title('PUT')
-    ax_put.set_xlabel('Spot Price')
-    ax_put.set_ylabel('Volatility')
+    xticks = tuple(spot_ticks)
+    yticks = tuple(vol_ticks)
+    fig_call = _make_heatmap_fig(_grid_bytes(call_prices),
+                                 call_prices.shape, xticks, yticks, 'CALL')
+    fig_put = _make_heatmap_fig(_grid_bytes(put_prices),
+                                put_prices.shape, xticks, yticks, 'PUT')
 
     return fig_call, fig_put
 
@@ -257,26 +266,38 @@ st.info("Explore how option prices fluctuate with varying 'Spot Prices and Volat
 # Interactive Sliders and Heatmaps for Call and Put Options
 col1, col2 = st.columns([1, 1], gap="small")
 
+# Axis tick labels, rounded once and shared by all four heatmaps
+spot_ticks = np.round(spot_range, 2)
+vol_ticks = np.round(vol_range, 2)
+
+# Price the grid once for both heatmap columns; the cache key is the
+# scalar widget inputs, so unrelated widget reruns reuse the grids.
+call_grid, put_grid = compute_bs_grids(
+    spot_min, spot_max, vol_min, vol_max,
+    time_to_maturity, strike, interest_rate/100)
+
+# Each plotting helper returns both figures, so call it once and use
+# both returns instead of invoking it once per column.
+heatmap_fig_call, heatmap_fig_put = plot_heatmap(
+    call_grid, put_grid, spot_ticks, vol_ticks)
+pnl_fig_call, pnl_fig_put = plot_pnl_heatmap(
+    spot_range, vol_range, strike, purchase_price_call, purchase_price_put,
+    spot_ticks, vol_ticks)
+
 with col1:
     st.subheader("Call Price Heatmap")
-    heatmap_fig_call, _ = plot_heatmap(bs_model, spot_range, vol_range, strike)
-    st.pyplot(heatmap_fig_call)
+    st.plotly_chart(heatmap_fig_call, use_container_width=True)
 
 with col2:
     st.subheader("Put Price Heatmap")
-    _, heatmap_fig_put = plot_heatmap(bs_model, spot_range, vol_range, strike)
-    st.pyplot(heatmap_fig_put)
+    st.plotly_chart(heatmap_fig_put, use_container_width=True)
 
 with col1:
     st.subheader(
         "Call Option P&L Heatmap based on Purchase Price for CALL Option")
-    heatmap_fig_call, _ = plot_pnl_heatmap(
-        bs_model, spot_range, vol_range, strike, purchase_price_call, purchase_price_put)
-    st.pyplot(heatmap_fig_call)
+    st.plotly_chart(pnl_fig_call, use_container_width=True)
 
 with col2:
     st.subheader(
         "Put Option P&L Heatmap based on Purchase Price for PUT Option")
-    _, heatmap_fig_put = plot_pnl_heatmap(
-        bs_model, spot_range, vol_range, strike, purchase_price_call, purchase_price_put)
-    st.pyplot(heatmap_fig_put)
+    st.plotly_chart(pnl_fig_put, use_container_width=True)